@@ -1,70 +1,92 @@
+import functools
+import math
 import struct
 import qdarktheme
 from PyQt6 import QtGui, QtCore, QtWidgets
-from math import * # for user calculation convenience
 
-def to_float(value):
-    # interpret the bits of value as IEEE 754 floating point number
-    # see https://en.wikipedia.org/wiki/IEEE_754
+# names available to user expressions: everything public from math plus a
+# few numeric builtins. Handing eval this small namespace keeps its name
+# lookups off the module globals and away from the rest of the builtins
+_EVAL_NAMESPACE = {name: value for name, value in vars(math).items()
+                   if not name.startswith('_')}
+_EVAL_NAMESPACE['__builtins__'] = {
+    'abs': abs, 'bin': bin, 'divmod': divmod, 'float': float, 'hex': hex,
+    'int': int, 'max': max, 'min': min, 'oct': oct, 'pow': pow,
+    'round': round,
+}
+
+def to_float_value(value):
+    # interpret the bits of value as IEEE 754 floating point number in a
+    # single reinterpretation, letting struct handle nan/inf/subnormals
+    return struct.unpack('>f', struct.pack('>I', value & 0xFFFFFFFF))[0]
+
+def to_float_string(value):
+    # build a human-readable sign/exponent/mantissa breakdown of value
+    # interpreted as IEEE 754, see https://en.wikipedia.org/wiki/IEEE_754
 
-    literal = 0
     string = ''
 
     sign = (value >> 31) & 0x01
     exponent = (value >> 23) & 0xFF
     fraction = (value & 0x7FFFFF)
 
-    literal = (-1) ** (sign)
-    string += f'{(-1) ** (sign)}*'
+    string += f'{-1 if sign else 1}*'
 
     if exponent == 0xFF:
-        # nan/inf
-        if fraction == 0x00:
-            if sign == 0x01:
-                literal = float('-inf')
-            else:
-                literal = float('+inf')
-        else:
-            literal = float('nan')
-
+        # nan/inf, no breakdown to show
         string = ''
-
     elif exponent == 0x00:
         # subnormal number
-        literal *= 2 ** (-126) * fraction / (2**23)
-        string += f'2^(-126)*({fraction / (2**23)})'
+        string += f'2^(-126)*({math.ldexp(fraction, -23)})'
     else:
         # normal number
-        literal *= 2 ** ((exponent) - 127)
-        literal *= (1 + fraction / (2**23))
-
         string += f'2^({exponent} - 127)*'
-        string += f'({1 + fraction / (2**23)})'
+        string += f'({1 + math.ldexp(fraction, -23)})'
+
+    return string
 
-    return literal, string
+_mono_font = None
 
 def monospace():
-    # Returns a suitable QFont that looks ok on all platforms
-    from sys import platform
-    if platform == "darwin":
-        font = QtGui.QFont('Monaco')
-    else:
-        font = QtGui.QFont('monospace')
-    font.setStyleHint(QtGui.QFont.StyleHint.Monospace)
-    return font
+    # Returns a suitable QFont that looks ok on all platforms. The font is
+    # constructed once and shared; QFont is implicitly shared in Qt so
+    # every caller can reuse the same instance
+    global _mono_font
+    if _mono_font is None:
+        from sys import platform
+        if platform == "darwin":
+            font = QtGui.QFont('Monaco')
+        else:
+            font = QtGui.QFont('monospace')
+        font.setStyleHint(QtGui.QFont.StyleHint.Monospace)
+        _mono_font = font
+    return _mono_font
 
 class BinaryTableItem(QtWidgets.QTableWidgetItem):
     '''
         Clickable QTableWidgetItem displaying a single bit
     '''
-    def __init__(self, index):
+
+    # shared constants so toggling does not re-format text or
+    # re-construct colors for every bit. QBrush instances are shared too,
+    # sparing the implicit QColor-to-QBrush conversion per set call
+    _TEXT_OFF = '0'
+    _TEXT_ON = '1'
+    _BRUSH_LIMIT = QtGui.QBrush(QtGui.QColor(200, 240, 200))
+    _BRUSH_SET = QtGui.QBrush(QtGui.QColor(240, 200, 200))
+    _BRUSH_BLACK = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+
+    def __init__(self, index, view):
         QtWidgets.QTableWidgetItem.__init__(self)
 
         self.index = index
+        self.view = view
+        self._mask = 1 << index
         self.value = False
         self.is_bit_limit = False
         self.is_pressed = False
 
+        self.setText(self._TEXT_OFF)
         self.setFont(monospace())
         self.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled)
@@ -95,36 +117,50 @@ class BinaryTableItem(QtWidgets.QTableWidgetItem):
 
     def toggle(self):
         self.value = not self.value
-        self.setText(f'{self.value:b}')
+        self.view._value_mask ^= self._mask
+        self.setText(self._TEXT_ON if self.value else self._TEXT_OFF)
         self._update_color()
 
     def _update_color(self):
         if self.is_bit_limit:
-            self.setBackground(QtGui.QColor(200, 240, 200))
-            self.setForeground(QtGui.QColor(0, 0, 0))
+            self.setBackground(self._BRUSH_LIMIT)
+            self.setForeground(self._BRUSH_BLACK)
         elif self.value:
-            self.setBackground(QtGui.QColor(240, 200, 200))
-            self.setForeground(QtGui.QColor(0, 0, 0))
+            self.setBackground(self._BRUSH_SET)
+            self.setForeground(self._BRUSH_BLACK)
         else:
             self.setBackground(self.defaultBackground)
             self.setForeground(self.defaultForeground)
 
     def force_to(self, value):
+        if self.value == value:
+            # already displaying this state, nothing to rewrite
+            return
         self.value = value
-        self.setText(f'{self.value:b}')
+        if value:
+            self.view._value_mask |= self._mask
+        else:
+            self.view._value_mask &= ~self._mask
+        self.setText(self._TEXT_ON if self.value else self._TEXT_OFF)
         self._update_color()
 
 
+# legend strings for every possible bit index, formatted once
+_LEGEND_STRS = tuple(str(i) for i in range(64))
+
 class BinaryTableLegend(QtWidgets.QTableWidgetItem):
     '''
         Non-clickable table element showing an index for BinaryView
     '''
+
+    # alignment flags OR'd once instead of per constructed legend
+    _ALIGNMENT = (QtCore.Qt.AlignmentFlag.AlignBottom |
+                  QtCore.Qt.AlignmentFlag.AlignHCenter)
+
     def __init__(self, index):
         QtWidgets.QTableWidgetItem.__init__(self)
-        self.setText(f'{index}')
-        self.setTextAlignment(
-            QtCore.Qt.AlignmentFlag.AlignBottom |
-            QtCore.Qt.AlignmentFlag.AlignHCenter)
+        self.setText(_LEGEND_STRS[index])
+        self.setTextAlignment(self._ALIGNMENT)
         self.setFlags(QtCore.Qt.ItemFlag.ItemNeverHasChildren)
         self.setFont(monospace())
 
@@ -151,6 +187,10 @@ class BinaryTableLabel(QtWidgets.QTableWidgetItem):
         self.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignTop)
         self.setFont(monospace())
 
+# columns holding spacers instead of bits, per table mode
+_INT_SPACER_COLS = frozenset((8, 17, 26))
+_FLOAT_SPACER_COLS = frozenset((23, 32))
+
 class BinaryView(QtWidgets.QTableWidget):
     '''
         Class inheriting QTableWidget for creating and populating a table containing
@@ -166,12 +206,22 @@ class BinaryView(QtWidgets.QTableWidget):
 
         self.callbacks = []
         self.table_elements = []
+        self._value_mask = 0
+        self._sign_bit_index = None
         self.mode = mode
         self.error_message = None
         self.previously_clicked_cell = None
         self.n_cols = 32
+        self._built_layout = None
         self.force_float_fn = force_float_fn
 
+        # coalesce rapid updates (e.g. dragging across bits) so each
+        # event-loop pass triggers at most one callback round
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._do_callback)
+
         # register callback for mouse event (cell entered while mouse pressed)
         self.itemEntered.connect(self._on_item_entered)
         self.set_new_bit_width(n_bits)
@@ -186,11 +236,9 @@ class BinaryView(QtWidgets.QTableWidget):
     def get_value(self):
         # Returns an interpretation of the binary number present in the view
 
-        # find unsigned value
-        as_uint = 0
-        for item in self.table_elements:
-            if item.value:
-                as_uint += (1 << item.index)
+        # the unsigned value is maintained incrementally as bits are toggled,
+        # so no per-bit scan is needed here
+        as_uint = self._value_mask
 
         # find signed value
         bit_limit = self.get_sign_bit_index()
@@ -202,8 +250,7 @@ class BinaryView(QtWidgets.QTableWidget):
         if self.mode == self.MODE_INT:
             return as_uint, as_int, None
         elif self.mode == self.MODE_FLOAT:
-            as_float, _ = to_float(as_uint)
-            return as_uint, as_int, as_float
+            return as_uint, as_int, to_float_value(as_uint)
 
     def set_value(self, value):
 
@@ -220,30 +267,47 @@ class BinaryView(QtWidgets.QTableWidget):
             return
 
         if self.mode == self.MODE_FLOAT:
-            # pack and unpack to get integer representation of hex
-            tmp = struct.pack('>f', value)
-            value = int(tmp.hex(), 16)
-
-        # reset bit limits (in case previous value was signed)
-        for bit in self.table_elements:
-            bit.set_is_bit_limit(False)
-
-        value = int(value)
+            # reinterpret the float's bits as an integer directly
+            value = int.from_bytes(struct.pack('>f', value), 'big')
 
-        # sanity check: abort if we cannot display it
-        if value >= 2**self.n_bits:
-            self.error_message = f'\nOut of {self.n_bits} bit range'
-            self._callback()
-            return
-        elif value < 0:
-            self.table_elements[-1].set_is_bit_limit(True)
-
-        # upadte bit field to match value
-        for bit in range(self.n_bits):
-            if (1 << bit) & value:
-                self.table_elements[bit].force_to(True)
+        # suppress per-cell repaints and change signals while updating the
+        # whole table, then repaint once at the end
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            # reset the bit limit (in case previous value was signed); at
+            # most one cell carries it, so no need to sweep the whole table
+            if self._sign_bit_index is not None:
+                self.table_elements[self._sign_bit_index].set_is_bit_limit(False)
+                self._sign_bit_index = None
+
+            value = int(value)
+
+            # sanity check: abort if we cannot display it. bit_length avoids
+            # comparing against a fresh 2**n_bits int and also catches
+            # negative magnitudes beyond the table width
+            if value.bit_length() > self.n_bits:
+                self.error_message = f'\nOut of {self.n_bits} bit range'
             else:
-                self.table_elements[bit].force_to(False)
+                if value < 0:
+                    self.table_elements[-1].set_is_bit_limit(True)
+                    self._sign_bit_index = self.n_bits - 1
+                    # show negative numbers by their two's complement bit
+                    # pattern at the current width; the changed-bits walk
+                    # below needs a non-negative value to terminate
+                    value &= self._range_limit - 1
+
+                # update bit field to match value, only touching bits that
+                # actually changed so unchanged cells skip their Qt
+                # text/color updates
+                diff = value ^ self._value_mask
+                while diff:
+                    bit = (diff & -diff).bit_length() - 1
+                    self.table_elements[bit].force_to(
+                        bool(value & self._bit_masks[bit]))
+                    diff &= diff - 1
+        finally:
+            self._end_batch()
 
         self._callback()
 
@@ -251,11 +315,18 @@ class BinaryView(QtWidgets.QTableWidget):
         self.callbacks.append(callback)
 
     def set_sign_bit_index(self, index):
-        for bit in self.table_elements:
-            if bit.index == index:
-                bit.toggle_is_bit_limit()
-            else:
-                bit.set_is_bit_limit(False)
+        # at most two cells change state: the previous sign bit and the
+        # clicked one. Clicking the current sign bit again clears it
+        prev = self._sign_bit_index
+
+        if prev == index:
+            self.table_elements[index].set_is_bit_limit(False)
+            self._sign_bit_index = None
+        else:
+            if prev is not None:
+                self.table_elements[prev].set_is_bit_limit(False)
+            self.table_elements[index].set_is_bit_limit(True)
+            self._sign_bit_index = index
 
         self._callback()
 
@@ -283,24 +354,51 @@ class BinaryView(QtWidgets.QTableWidget):
             print("invalid number of bits requested, choose from 32, 64")
             return
 
-        # delete table elements if they exist
-        while self.rowCount() > 0:
-            self.removeRow(0)
-        self.table_elements = []
-
-        self.n_bits = n_bits
-
-        # helper variables for constructing table
-        self.width = int(n_bits / 2)
-        self.n_spacers = int(self.width / 8 - 1)
-        self.n_cols = self.width + self.n_spacers
+        # skip the teardown/rebuild when the requested layout is already in
+        # place. Int and float layouts differ in geometry even at the same
+        # width, so the mode is part of the key
+        if (n_bits, self.mode) == self._built_layout:
+            return
+        self._built_layout = (n_bits, self.mode)
 
-        if self.mode == self.MODE_FLOAT:
-            self._init_table_properties_float()
-            self._populate_table_float()
-        elif self.mode == self.MODE_INT:
-            self._init_table_properties_int()
-            self._populate_table_int()
+        # suppress repaints/signals for the full teardown and rebuild
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            # delete table elements if they exist
+            while self.rowCount() > 0:
+                self.removeRow(0)
+            self.table_elements = []
+            self._value_mask = 0
+            self._sign_bit_index = None
+
+            self.n_bits = n_bits
+            self._range_limit = 1 << n_bits
+            self._bit_masks = tuple(1 << i for i in range(n_bits))
+
+            # helper variables for constructing table
+            self.width = int(n_bits / 2)
+            self.n_spacers = int(self.width / 8 - 1)
+            self.n_cols = self.width + self.n_spacers
+
+            if self.mode == self.MODE_FLOAT:
+                self._init_table_properties_float()
+                self._populate_table_float()
+            elif self.mode == self.MODE_INT:
+                self._init_table_properties_int()
+                self._populate_table_int()
+
+            # single measurement pass now that all items are in place
+            self.resizeColumnsToContents()
+        finally:
+            self._end_batch()
+
+    def _end_batch(self):
+        # counterpart to the setUpdatesEnabled/blockSignals pairs above:
+        # re-enable and issue the single deferred repaint
+        self.blockSignals(False)
+        self.setUpdatesEnabled(True)
+        self.viewport().update()
 
     def _init_table_properties_float(self):
 
@@ -334,26 +432,35 @@ class BinaryView(QtWidgets.QTableWidget):
             QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setSizeAdjustPolicy(
             QtWidgets.QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents)
-        self.resizeColumnsToContents()
+
+        # fixed mode keeps Qt from re-measuring sections as items are
+        # inserted; columns are sized once after population instead. Cells
+        # are single-line so word wrapping is measurement cost for nothing
+        self.setWordWrap(False)
+        self.horizontalHeader().setSectionResizeMode(
+            QtWidgets.QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setSectionResizeMode(
+            QtWidgets.QHeaderView.ResizeMode.Fixed)
 
     def _populate_table_float(self):
 
         # brute-force way of populating the table with clickable bits, labels and spacers
+        set_item = self.setItem
         digit_index = 0
         for col in range(self.n_cols):
 
             reverse_index = self.n_cols - 1 - col
 
-            if col == 32 or col == 23:
-                self.setItem(0, reverse_index, BinaryTableSpacer())
-                self.setItem(1, reverse_index, BinaryTableSpacer())
+            if col in _FLOAT_SPACER_COLS:
+                set_item(0, reverse_index, BinaryTableSpacer())
+                set_item(1, reverse_index, BinaryTableSpacer())
             else:
-                item = BinaryTableItem(digit_index)
+                item = BinaryTableItem(digit_index, self)
                 self.table_elements.append(item)
-                self.setItem(1, reverse_index, item)
+                set_item(1, reverse_index, item)
 
                 item = BinaryTableLegend(digit_index)
-                self.setItem(0, reverse_index, item)
+                set_item(0, reverse_index, item)
 
                 digit_index += 1
 
@@ -366,42 +473,39 @@ class BinaryView(QtWidgets.QTableWidget):
 
     def _populate_table_int(self):
 
-        # brute-force way of populating the table with clickable bits, labels and spacers
+        # populate the table with clickable bits, labels and spacers in one
+        # pass: the low half of the word lives in rows 2-3, the high half
+        # in rows 0-1, offset by self.width. Hoist the bound methods and
+        # constructors to locals to keep the loop body lean
+        set_item = self.setItem
+        spacer = BinaryTableSpacer
+        bit = BinaryTableItem
+        legend = BinaryTableLegend
+
         digit_index = 0
+        high_elements = []
         for col in range(self.n_cols):
 
             reverse_index = self.n_cols - 1 - col
 
-            if col == 8 or col == 17 or col == 26:
-                self.setItem(2, reverse_index, BinaryTableSpacer())
-                self.setItem(3, reverse_index, BinaryTableSpacer())
+            if col in _INT_SPACER_COLS:
+                for row in range(4):
+                    set_item(row, reverse_index, spacer())
             else:
-                item = BinaryTableItem(digit_index)
+                item = bit(digit_index, self)
                 self.table_elements.append(item)
-                self.setItem(3, reverse_index, item)
+                set_item(3, reverse_index, item)
+                set_item(2, reverse_index, legend(digit_index))
 
-                item = BinaryTableLegend(digit_index)
-                self.setItem(2, reverse_index, item)
+                item = bit(digit_index + self.width, self)
+                high_elements.append(item)
+                set_item(1, reverse_index, item)
+                set_item(0, reverse_index, legend(digit_index + self.width))
 
                 digit_index += 1
 
-        for col in range(self.n_cols):
-
-            reverse_index = self.n_cols - 1 - col
-
-            if col == 8 or col == 17 or col == 26:
-                self.setItem(0, reverse_index, BinaryTableSpacer())
-                self.setItem(1, reverse_index, BinaryTableSpacer())
-            else:
-
-                item = BinaryTableItem(digit_index)
-                self.table_elements.append(item)
-                self.setItem(1, reverse_index, item)
-
-                item = BinaryTableLegend(digit_index)
-                self.setItem(0, reverse_index, item)
-
-                digit_index += 1
+        # keep table_elements ordered by bit index
+        self.table_elements.extend(high_elements)
 
 
     def _on_item_entered(self, item):
@@ -418,15 +522,15 @@ class BinaryView(QtWidgets.QTableWidget):
         self._callback()
 
     def get_sign_bit_index(self):
-        limit = None
-
-        for bit in self.table_elements:
-            if bit.is_bit_limit:
-                limit = bit.index
-
-        return limit
+        # tracked incrementally wherever bit limits change, no scan needed
+        return self._sign_bit_index
 
     def _callback(self):
+        # starting an already-running single-shot timer restarts it, so
+        # several requests within one event-loop pass fire only once
+        self._update_timer.start()
+
+    def _do_callback(self):
 
         signed, unsigned, flt = self.get_value()
 
@@ -437,12 +541,21 @@ class BinaryView(QtWidgets.QTableWidget):
         self.error_message = None
 
     def _twos_complement(self, ones_complement, nBits):
-        # helper function for calculating two's complement at arbitrary bit depth
-        if ones_complement & 1 << (nBits - 1) == 0:
-            return ones_complement
-        else:
-            return ((~ones_complement + 1) & ((1 << nBits) - 1)) * -1
-
+        # helper function for calculating two's complement at arbitrary bit
+        # depth. Bits above nBits (sign bit below the highest set bit) must
+        # not leak into the readout, so mask to width before testing the
+        # sign bit and conditionally subtracting 2^nBits
+        masked = ones_complement & ((1 << nBits) - 1)
+        if (masked >> (nBits - 1)) & 1:
+            return masked - (1 << nBits)
+        return ones_complement
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_input(text):
+    # compile expressions once; re-running a previously entered input is
+    # common in a calculator session and skips the parse/compile step
+    return compile(text, '<input>', 'eval')
 
 class InputLabel(QtWidgets.QLineEdit):
     '''
@@ -455,6 +568,8 @@ class InputLabel(QtWidgets.QLineEdit):
         self.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight)
         self.returnPressed.connect(self._on_changed)
         self.callbacks = []
+        self._last_text = None
+        self._last_value = None
 
     def connect(self, callback):
         self.callbacks.append(callback)
@@ -476,21 +591,56 @@ class InputLabel(QtWidgets.QLineEdit):
 
     def _on_changed(self):
 
+        text = self.text()
+
         try:
-            res = eval(self.text())
-            if (isinstance(res, int) or isinstance(res, float)):
-                self._callback(res)
+            if text == self._last_text:
+                # unchanged input (Enter pressed again, mode toggles forcing
+                # re-evaluation) reuses the previous result directly
+                res = self._last_value
             else:
-                raise TypeError("Input must evaluate to a number") 
-        except Exception as e:
+                try:
+                    # plain integer literals (decimal/hex/octal/binary) are
+                    # the common case, parse them directly before falling
+                    # back to evaluating the input as an expression
+                    res = int(text, 0)
+                except ValueError:
+                    res = eval(_compile_input(text), _EVAL_NAMESPACE)
+                if not (isinstance(res, int) or isinstance(res, float)):
+                    raise TypeError("Input must evaluate to a number")
+
+            self._callback(res)
+
+            # cache only once the callback chain has accepted the value; it
+            # may reject a perfectly numeric result (e.g. a float too large
+            # to pack in float mode), and replays take the same try/except
+            self._last_text = text
+            self._last_value = res
+        except Exception:
             # treat all exceptions as syntax error
             self._callback('\nSyntax error')
-            print(self.text())
-            print(e)
 
         self.setFocus()
         self.selectAll()
 
+@functools.lru_cache(maxsize=512)
+def _format_result(as_unsigned, as_int, as_flt, error_message):
+    # assemble the display string for ResultField. Dragging across bits
+    # revisits the same values often, so memoize per input tuple
+    if error_message is not None:
+        return error_message
+
+    if as_flt is not None:
+        middle = f'{to_float_string(as_unsigned)} = {as_flt}'
+    elif as_int is not None:
+        middle = str(as_int)
+    else:
+        middle = str(as_unsigned)
+
+    # bin()/hex() take the C fast path for plain ints, and a single join
+    # avoids growing the string piece by piece
+    return '\n'.join((bin(as_unsigned), middle, hex(as_unsigned)))
+
 class ResultField(QtWidgets.QLabel):
     '''
         Class inheriting QLabel for displaying results
@@ -499,6 +649,7 @@ class ResultField(QtWidgets.QLabel):
         QtWidgets.QLabel.__init__(self)
         self.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight)
         self.result = ""
+        self._last_args = None
         self.setFont(monospace())
 
         # allow user to select text
@@ -511,22 +662,14 @@ class ResultField(QtWidgets.QLabel):
 
     def set_result(self, as_unsigned=None, as_int=None, as_flt=None, error_message=None):
 
-        to_print = ''
-
-        if error_message is not None:
-            to_print = error_message
-        else:
-            to_print += f'0b{as_unsigned:b}\n'
-
-            if as_flt is not None:
-                literal, string = to_float(as_unsigned)
-                to_print += string + f' = {literal}' + '\n'
-            elif as_int is not None:
-                to_print += f'{as_int}\n'
-            else:
-                to_print += f'{as_unsigned}\n'
+        # redundant refreshes (e.g. a callback that did not change the
+        # value) would re-set identical label text, skip them
+        args = (as_unsigned, as_int, as_flt, error_message)
+        if args == self._last_args:
+            return
+        self._last_args = args
 
-            to_print += f'0x{as_unsigned:x}'
+        to_print = _format_result(as_unsigned, as_int, as_flt, error_message)
         self.result = to_print
         self.setText(to_print)
 
@@ -602,7 +745,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.binary_view.set_value(curr_val)
 
             # if curr_val was signed, update sign bit as well
-            if sign_bit:
+            if sign_bit is not None:
                 self.binary_view.set_sign_bit_index(sign_bit)
 
         else:
@@ -622,9 +765,8 @@ class MainWindow(QtWidgets.QMainWindow):
             self.binary_view.set_value(new_val)
 
             # if curr_val was signed, update sign bit as well
-            if sign_bit:
-                if sign_bit < 32:
-                    self.binary_view.set_sign_bit_index(sign_bit)
+            if sign_bit is not None and sign_bit < 32:
+                self.binary_view.set_sign_bit_index(sign_bit)
 
         new_size = self.central_widget.sizeHint()
         self.setFixedSize(new_size)